@@ -1,51 +1,210 @@
 # Standard library imports
+import copy
+import hashlib
 import json
+import logging
+import math
+import random
 import sys
 import os
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import TYPE_CHECKING, ClassVar, List, Optional
 
-# Third-party imports
-import requests
-import click
+# Third-party imports, requests and click are imported on first use to keep
+# `import rescaleapi` cheap
+if TYPE_CHECKING:
+    import requests
+
+# orjson is an optional speedup, its decode errors and those of the stdlib
+# fallback (including UnicodeDecodeError on non UTF-8 bytes) are ValueErrors
+try:
+    from orjson import dumps as _json_dumps, loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        """Serialize to compact JSON bytes."""
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+log = logging.getLogger(__name__)
 
 # Default timeout for API requests in seconds
 DEFAULT_TIMEOUT = 60
 
+# Timeout for bulk catalog listings in seconds
+CATALOG_TIMEOUT = 200
+
+# Timeout for file uploads in seconds, the server may digest large files slowly
+UPLOAD_TIMEOUT = 300
+
+# Bytes of an error response body echoed before exiting
+MAX_ERROR_BODY = 2048
+
+# Attempts for a request failing with a connection error or retryable status
+MAX_RETRIES = 5
+
+# Upper bound in seconds of the random jitter added to each retry backoff
+RETRY_JITTER = 2.0
+
+# Connections kept alive per host by the shared session
+POOL_SIZE = 32
+
+# Connections kept open by each shared async client
+ASYNC_POOL_SIZE = 50
+
+# Maximum number of files uploaded concurrently
+MAX_UPLOAD_WORKERS = 8
+
+# Bytes sampled from each end of a file to recognise repeat uploads
+UPLOAD_HASH_SAMPLE = 64 * 1024
+
+# Seconds a catalog response (coretypes, analyses) is reused
+CATALOG_CACHE_TTL = 24 * 60 * 60
+
+# Results requested per page when listing a whole catalog
+CATALOG_PAGE_SIZE = 500
+
+# Maximum number of catalog pages fetched concurrently
+MAX_PAGE_WORKERS = 8
+
+# Whether catalog responses are also kept on disk between runs, opt in by
+# setting RESCALE_CATALOG_CACHE=1 or this flag
+CATALOG_DISK_CACHE = os.environ.get("RESCALE_CATALOG_CACHE") == "1"
+
+# Directory holding catalog responses between runs
+CATALOG_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache")),
+    "rescaleapi",
+)
+
+# Headers for pre-serialized JSON request bodies
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Shared session so consecutive API calls reuse pooled TCP/TLS connections,
+# created on first use
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+# API key stored by set_api_key, read before falling back to the environment
+_API_KEY: Optional[str] = None
+
+# Rescale file ids of local files uploaded by this process, keyed by
+# (_file_key, api_key)
+_UPLOAD_CACHE = {}
+
+# Catalog responses with their fetch time, keyed by (endpoint, api_key)
+_CATALOG_CACHE = {}
+
+# Shared async clients, one per event loop since their connections are bound to
+# the loop that opened them, created on first use since httpx is optional
+_ASYNC_CLIENTS = weakref.WeakKeyDictionary()
+
+# Semaphores capping concurrent async uploads at MAX_UPLOAD_WORKERS across all
+# jobs, one per event loop like the clients
+_ASYNC_UPLOAD_SLOTS = weakref.WeakKeyDictionary()
+
 def set_api_key(api_key: str) -> None:
-    """Store Rescale API key in environment."""
+    """Store Rescale API key in module, environment and shared clients."""
+    global _API_KEY
+    _API_KEY = api_key
+    # Keep the environment in sync for subprocesses
     os.environ["RESCALE_API_KEY"] = api_key
+    if _SESSION is not None:
+        _SESSION.headers["Authorization"] = f"Token {api_key}"
+    for client in list(_ASYNC_CLIENTS.values()):
+        client.headers["Authorization"] = f"Token {api_key}"
 
 def get_api_key() -> str:
-    """Get Rescale API key from environment."""
-    return os.environ.get("RESCALE_API_KEY")
+    """Get Rescale API key, falling back to the environment."""
+    return _API_KEY or os.environ.get("RESCALE_API_KEY")
 
-@dataclass
-class ApiResponse:
-    """Base class for API interactions."""
-    BASE_URL = "https://platform.rescale.com/api/v2/"
+def _new_session():
+    """Create a session with pooled connections and jittered retries."""
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 
-    def __post_init__(self):
-        """Set API key after init."""
-        self.api_key = get_api_key()
+    class JitteredRetry(Retry):
+        """Retry policy spreading exponential backoff with random jitter."""
 
-    def _get_headers(self) -> dict:
-        """Get request headers."""
-        return {
-            "Content-Type": "application/json",
-            "Authorization": f"Token {self.api_key}",
-        }
+        def get_backoff_time(self) -> float:
+            """Get backoff time plus jitter so parallel clients spread retries."""
+            backoff = super().get_backoff_time()
+            if not backoff:
+                return backoff
+            return backoff + random.uniform(0, RETRY_JITTER)  # noqa: S311
+
+        def is_retry(
+            self, method: str, status_code: int, has_retry_after: bool = False
+        ) -> bool:
+            """Check whether a response status should be retried."""
+            # The server may already have acted on a POST, so only replay one it
+            # explicitly asked to be sent again later
+            if method.upper() == "POST":
+                return bool(
+                    self.total
+                    and self.respect_retry_after_header
+                    and has_retry_after
+                    and status_code in (429, 503)
+                )
+            return super().is_retry(method, status_code, has_retry_after)
+
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=POOL_SIZE,
+            pool_maxsize=POOL_SIZE,
+            max_retries=JitteredRetry(
+                total=MAX_RETRIES,
+                backoff_factor=1.0,
+                status_forcelist=[429, 500, 502, 503, 504, 529],
+                allowed_methods=["GET", "PATCH"],
+                respect_retry_after_header=True,
+                raise_on_status=False,
+            ),
+        ),
+    )
+    # Streamed upload bodies cannot be replayed, so uploads only retry failed connects
+    session.mount(
+        f"{ApiClient.BASE_URL}files/contents/",
+        HTTPAdapter(
+            pool_connections=POOL_SIZE,
+            pool_maxsize=POOL_SIZE,
+            max_retries=JitteredRetry(
+                total=MAX_RETRIES,
+                read=False,
+                backoff_factor=1.0,
+                respect_retry_after_header=False,
+            ),
+        ),
+    )
+    if get_api_key():
+        session.headers["Authorization"] = f"Token {get_api_key()}"
+    return session
+
+def _get_session():
+    """Get the shared session, creating it on first use."""
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                _SESSION = _new_session()
+    return _SESSION
+
+class ApiClient:
+    """Client for API interactions over the shared session."""
+    BASE_URL = "https://platform.rescale.com/api/v2/"
 
     def send_get(self, endpoint: str, timeout: int = DEFAULT_TIMEOUT) -> dict:
         """Send GET request."""
         url = f"{self.BASE_URL}{endpoint}"
-        with requests.Session() as session:
-            response = session.get(
-                url,
-                headers=self._get_headers(),
-                timeout=timeout,
-            )
-            return self.parse_response(response)
+        response = _get_session().get(url, timeout=timeout)
+        return self.parse_response(response)
 
     def send_post(
         self,
@@ -55,37 +214,190 @@ class ApiResponse:
     ) -> dict:
         """Send POST request."""
         url = f"{self.BASE_URL}{endpoint}"
-        with requests.Session() as session:
-            response = session.post(
-                url,
-                headers=self._get_headers(),
-                json=json_data,
-                timeout=timeout,
-            )
-            return self.parse_response(response)
+        response = _get_session().post(
+            url,
+            data=None if json_data is None else _json_dumps(json_data),
+            headers=_JSON_HEADERS,
+            timeout=timeout,
+        )
+        return self.parse_response(response)
 
     @staticmethod
-    def parse_response(response: requests.Response) -> dict:
+    def parse_response(response: "requests.Response") -> dict:
         """Parse API response."""
         if response.status_code >= 300:
+            import click
+
             click.echo(f"Error: {response.status_code}")
-            click.echo(response.text)
+            click.echo(response.content[:MAX_ERROR_BODY].decode("utf-8", "replace"))
             sys.exit(1)
+        if not response.content:
+            return {}
+        try:
+            return _json_loads(response.content)
+        except ValueError as err:
+            import click
+
+            raise click.ClickException(
+                f"Invalid JSON from {response.url}: {err}"
+            ) from err
+
+# Former name of ApiClient, when API objects inherited from it
+ApiResponse = ApiClient
+
+def _get_catalog(endpoint: str, api_key: str) -> dict:
+    """Get a read-only catalog endpoint, cached in memory and optionally on disk."""
+    # Callers get a copy so mutating a result cannot corrupt the cache
+    cached = _CATALOG_CACHE.get((endpoint, api_key))
+    if cached and time.time() - cached["fetched_at"] < CATALOG_CACHE_TTL:
+        return copy.deepcopy(cached["data"])
+
+    url = f"{ApiClient.BASE_URL}{endpoint}"
+    digest = hashlib.sha256(f"{url} {api_key}".encode()).hexdigest()
+    path = os.path.join(CATALOG_CACHE_DIR, f"{digest}.json")
+    if CATALOG_DISK_CACHE:
+        try:
+            with open(path) as file:
+                cached = json.load(file)
+            if time.time() - cached["fetched_at"] < CATALOG_CACHE_TTL:
+                _CATALOG_CACHE[(endpoint, api_key)] = cached
+                return copy.deepcopy(cached["data"])
+        except (OSError, ValueError, KeyError):
+            pass
+
+    data = _API.send_get(endpoint, timeout=CATALOG_TIMEOUT)
+    cached = {"url": url, "fetched_at": time.time(), "data": data}
+    _CATALOG_CACHE[(endpoint, api_key)] = cached
+    if CATALOG_DISK_CACHE:
+        try:
+            os.makedirs(CATALOG_CACHE_DIR, exist_ok=True)
+            with open(f"{path}.{os.getpid()}", "w") as file:
+                json.dump(cached, file)
+            os.replace(f"{path}.{os.getpid()}", path)
+        except OSError:
+            pass
+    return copy.deepcopy(data)
+
+def _get_all_pages(endpoint: str) -> list:
+    """Get results of every page of a catalog endpoint."""
+    api_key = get_api_key()
+
+    def get_page(page: int) -> dict:
+        return _get_catalog(
+            f"{endpoint}?page={page}&page_size={CATALOG_PAGE_SIZE}", api_key
+        )
+
+    first = get_page(1)
+    results = list(first["results"])
+    # Derive the page count from what was returned in case the server caps page_size
+    pages = math.ceil(first["count"] / len(results)) if results else 1
+    if pages > 1:
+        with ThreadPoolExecutor(max_workers=MAX_PAGE_WORKERS) as executor:
+            for page in executor.map(get_page, range(2, pages + 1)):
+                results.extend(page["results"])
+    return results
+
+def _file_key(path: str) -> tuple:
+    """Identify a local file by real path, mtime, size and sampled content."""
+    stat = os.stat(path)
+    # Sampling cannot tell same-named files apart if they only differ in the
+    # middle, so files at different real paths never share a key
+    digest = hashlib.sha256(f"{os.path.realpath(path)} {stat.st_mtime_ns}".encode())
+    with open(path, "rb") as file:
+        digest.update(file.read(UPLOAD_HASH_SAMPLE))
+        if stat.st_size > UPLOAD_HASH_SAMPLE:
+            file.seek(max(stat.st_size - UPLOAD_HASH_SAMPLE, UPLOAD_HASH_SAMPLE))
+            digest.update(file.read())
+    return digest.hexdigest(), stat.st_size
+
+def clear_catalog_cache() -> None:
+    """Drop cached catalog responses from memory and disk."""
+    _CATALOG_CACHE.clear()
+    if os.path.isdir(CATALOG_CACHE_DIR):
+        for name in os.listdir(CATALOG_CACHE_DIR):
+            if name.endswith(".json"):
+                os.remove(os.path.join(CATALOG_CACHE_DIR, name))
+
+def _get_async_client():
+    """Get the running event loop's httpx client, creating it on first use."""
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    client = _ASYNC_CLIENTS.get(loop)
+    if client is None:
         try:
-            return response.json()
-        except json.JSONDecodeError:
-            return response.text
+            import httpx
+        except ImportError as err:
+            raise ImportError(
+                "Async support requires httpx: pip install rescaleapi[async]"
+            ) from err
+        client = _ASYNC_CLIENTS[loop] = httpx.AsyncClient(
+            base_url=ApiClient.BASE_URL,
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=ASYNC_POOL_SIZE,
+                max_keepalive_connections=ASYNC_POOL_SIZE,
+            ),
+        )
+        if get_api_key():
+            client.headers["Authorization"] = f"Token {get_api_key()}"
+    return client
+
+def _get_upload_slots():
+    """Get the running event loop's upload semaphore, creating it on first use."""
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    slots = _ASYNC_UPLOAD_SLOTS.get(loop)
+    if slots is None:
+        slots = _ASYNC_UPLOAD_SLOTS[loop] = asyncio.Semaphore(MAX_UPLOAD_WORKERS)
+    return slots
 
-@dataclass
-class Hardware(ApiResponse):
+class AsyncApiClient:
+    """Client for asynchronous API interactions over the shared httpx client."""
+    BASE_URL = ApiClient.BASE_URL
+
+    # Responses are parsed the same way as synchronous ones
+    parse_response = staticmethod(ApiClient.parse_response)
+
+    async def send_get(self, endpoint: str, timeout: int = DEFAULT_TIMEOUT) -> dict:
+        """Send GET request asynchronously."""
+        response = await _get_async_client().get(endpoint, timeout=timeout)
+        return self.parse_response(response)
+
+    async def send_post(
+        self,
+        endpoint: str,
+        json_data: Optional[dict] = None,
+        timeout: int = DEFAULT_TIMEOUT,
+    ) -> dict:
+        """Send POST request asynchronously."""
+        response = await _get_async_client().post(
+            endpoint,
+            content=None if json_data is None else _json_dumps(json_data),
+            headers=_JSON_HEADERS,
+            timeout=timeout,
+        )
+        return self.parse_response(response)
+
+# Shared clients used by the API objects below
+_API = ApiClient()
+_ASYNC_API = AsyncApiClient()
+
+@dataclass(slots=True)
+class Hardware:
     """Hardware configuration settings."""
     coreType: str = "emerald_max"
     coresPerSlot: int = 1
     slots: int = 1
 
     def get_available_hardwares(self, page: int = 1) -> dict:
-        """Get hardware options."""
-        return self.send_get(f"coretypes?page={page}")
+        """Get hardware options (cached, see CATALOG_CACHE_TTL)."""
+        return _get_catalog(f"coretypes?page={page}", get_api_key())
+
+    def get_all_hardwares(self) -> list:
+        """Get hardware options from every page, fetched concurrently."""
+        return _get_all_pages("coretypes")
 
     def to_json(self) -> dict:
         """Convert to JSON format."""
@@ -95,8 +407,8 @@ class Hardware(ApiResponse):
             "slots": self.slots,
         }
 
-@dataclass
-class File(ApiResponse):
+@dataclass(slots=True)
+class File:
     """File upload handler."""
     path: Optional[str] = None
     id: Optional[str] = None
@@ -105,25 +417,110 @@ class File(ApiResponse):
         """Upload file to platform."""
         if self.id:
             raise ValueError("File already uploaded")
+        self._upload((_file_key(self.path), get_api_key()))
 
-        url = f"{self.BASE_URL}files/contents/"
+    def _upload(self, key: tuple) -> None:
+        """Upload file unless one with the same upload cache key was uploaded."""
+        from requests_toolbelt.multipart.encoder import MultipartEncoder
+
+        if key in _UPLOAD_CACHE:
+            self.id = _UPLOAD_CACHE[key]
+            log.info("Reusing file %s for %s", self.id, self.path)
+            return
+
+        url = f"{_API.BASE_URL}files/contents/"
         with open(self.path, "rb") as file:
-            response = requests.post(
+            # Stream the file from disk instead of building the body in memory
+            encoder = MultipartEncoder(
+                fields={
+                    "file": (
+                        os.path.basename(self.path),
+                        file,
+                        "application/octet-stream",
+                    )
+                }
+            )
+            response = _get_session().post(
                 url,
-                timeout=DEFAULT_TIMEOUT,
-                files={"file": file},
-                headers={"Authorization": f"Token {self.api_key}"},
+                timeout=UPLOAD_TIMEOUT,
+                data=encoder,
+                headers={"Content-Type": encoder.content_type},
             )
-            result = self.parse_response(response)
+            result = _API.parse_response(response)
             self.id = result["id"]
+        _UPLOAD_CACHE[key] = self.id
+        log.info("Uploaded %s as file %s", self.path, self.id)
+
+    async def upload_async(self) -> None:
+        """Upload file to platform asynchronously."""
+        import asyncio
+
+        if self.id:
+            raise ValueError("File already uploaded")
+
+        # Hash on a thread so a large file does not stall the event loop
+        key = (await asyncio.to_thread(_file_key, self.path), get_api_key())
+        await self._upload_async(key)
+
+    async def _upload_async(self, key: tuple) -> None:
+        """Upload file asynchronously unless one with the same key was uploaded."""
+        if key in _UPLOAD_CACHE:
+            self.id = _UPLOAD_CACHE[key]
+            log.info("Reusing file %s for %s", self.id, self.path)
+            return
+
+        # Queue for a slot rather than on the client's pool, whose wait counts
+        # against UPLOAD_TIMEOUT
+        async with _get_upload_slots():
+            with open(self.path, "rb") as file:
+                response = await _get_async_client().post(
+                    "files/contents/",
+                    timeout=UPLOAD_TIMEOUT,
+                    files={"file": file},
+                )
+            result = _API.parse_response(response)
+            self.id = result["id"]
+        _UPLOAD_CACHE[key] = self.id
+        log.info("Uploaded %s as file %s", self.path, self.id)
 
     @classmethod
     def load_from_id(cls, id: str) -> "File":
         """Create from existing file ID."""
         return cls(id=id)
 
-@dataclass
-class Software(ApiResponse):
+def _group_pending(files) -> dict:
+    """Group files without an id by their upload cache key."""
+    # Concurrent uploads of the same file would all miss _UPLOAD_CACHE, so only
+    # the first file of each group is uploaded and the others copy its id. The
+    # key is handed to the upload so each file is hashed once
+    api_key = get_api_key()
+    groups = {}
+    for file in files:
+        if not file.id:
+            groups.setdefault((_file_key(file.path), api_key), {})[id(file)] = file
+    return {key: list(group.values()) for key, group in groups.items()}
+
+def _share_ids(groups: dict) -> None:
+    """Copy the id of each group's uploaded file to the rest of the group."""
+    for first, *rest in groups.values():
+        for file in rest:
+            file.id = first.id
+
+def _upload_concurrently(files) -> None:
+    """Upload files without an id on a thread pool."""
+    groups = _group_pending(files)
+    if not groups:
+        return
+    with ThreadPoolExecutor(max_workers=MAX_UPLOAD_WORKERS) as executor:
+        futures = [
+            executor.submit(group[0]._upload, key) for key, group in groups.items()
+        ]
+        for future in as_completed(futures):
+            future.result()
+    _share_ids(groups)
+
+@dataclass(slots=True)
+class Software:
     """Software configuration settings."""
     code: Optional[str] = None
     version: Optional[str] = None
@@ -132,15 +529,16 @@ class Software(ApiResponse):
     lic: Optional[str] = None
 
     def get_available_softwares(self, page: int = 1) -> dict:
-        """Get software options."""
-        return self.send_get(f"analyses?page={page}")
+        """Get software options (cached, see CATALOG_CACHE_TTL)."""
+        return _get_catalog(f"analyses?page={page}", get_api_key())
+
+    def get_all_softwares(self) -> list:
+        """Get software options from every page, fetched concurrently."""
+        return _get_all_pages("analyses")
 
     def upload_files(self) -> None:
-        """Upload input files."""
-        if self.inputfiles:
-            for file in self.inputfiles:
-                if not file.id:
-                    file.upload()
+        """Upload input files concurrently."""
+        _upload_concurrently(self.inputfiles or ())
 
     def to_json(self, hardware: Hardware) -> dict:
         """Convert to JSON format."""
@@ -152,81 +550,149 @@ class Software(ApiResponse):
             },
             "command": self.command,
             "hardware": hardware.to_json(),
-            "inputFiles": [{"id": file.id} for file in (self.inputfiles or [])],
+            "inputFiles": [{"id": file.id} for file in (self.inputfiles or ())],
             "envVars": {"LM_LICENSE_FILE": self.lic} if self.lic else {},
         }
 
-@dataclass
+@dataclass(slots=True)
 class Abaqus(Software):
     """Abaqus-specific settings."""
-    lic: str 
+    lic: Optional[str] = None
     code: str = "abaqus"
 
-    @staticmethod
-    def get_version_code(name: str) -> str:
+    _VERSION_CODES: ClassVar[dict] = {
+        "2024 HF4 (FlexNet Licensing)": "2024-hf4",
+        "2023 HF9 (FlexNet Licensing)": "2023-hf9",
+        "2023 HF4 (FlexNet Licensing)": "2023-hf4",
+        "2023 HF2 (FlexNet Licensing)": "2023-HF2",
+        "2023 HF1 (FlexNet Licensing)": "2023-HF1",
+        "2023 Golden (FlexNet Licensing)": "2023-golden",
+        "2022.HF9 (FlexNet Licensing)": "2022-2328",
+        "2022.HF5 (FlexNet Licensing)": "2022-2241",
+        "2022.HF4 (FlexNet Licensing)": "2022-2232",
+        "2022.HF3 (FlexNet Licensing)": "2022-2223",
+        "2022.HF1 (FlexNet Licensing)": "2022-2205",
+        "2022 Golden (FlexNet Licensing)": "2022-golden",
+        "2021.HF9 (FlexNet Licensing)": "2021-2140",
+        "2021.HF6 (FlexNet Licensing)": "2021-2117",
+        "2020.HF11 (FlexNet Licensing)": "2020-2136",
+        "2020.HF6 (FlexNet Licensing)": "2020-2046",
+        "2020.HF5 (FlexNet Licensing)": "2020-2038",
+        "2020 Golden (FlexNet Licensing)": "2020",
+        "2019.HF6 (FlexNet Licensing)": "2019-1947",
+        "2019 (FlexNet Licensing)": "2019",
+        "2018.HF10 (FlexNet Licensing)": "2018-1928",
+        "2018 (FlexNet Licensing HF4)": "2018",
+        "2017-efa-single-node": "2017-efa-single-node",
+        "2017": "2017",
+        "6.14-5": "6.14.5-pcmpi",
+        "6.14-3": "6.14.3-pcmpi",
+        "6.14-2": "6.14.2-pcmpi",
+        "6.13-5": "6.13.5-ibm",
+        "6.12-3": "6.12-3",
+    }
+    _AVAILABLE_KEYS: ClassVar[str] = ", ".join(_VERSION_CODES)
+    _CODE_TO_NAME: ClassVar[dict] = {
+        code: name for name, code in _VERSION_CODES.items()
+    }
+    _AVAILABLE_CODES: ClassVar[str] = ", ".join(_CODE_TO_NAME)
+
+    @classmethod
+    def get_version_code(cls, name: str) -> str:
         """Convert version name to code."""
-        codes = {
-            "2024 HF4 (FlexNet Licensing)": "2024-hf4",
-            "2023 HF9 (FlexNet Licensing)": "2023-hf9",
-            "2023 HF4 (FlexNet Licensing)": "2023-hf4",
-            "2023 HF2 (FlexNet Licensing)": "2023-HF2",
-            "2023 HF1 (FlexNet Licensing)": "2023-HF1",
-            "2023 Golden (FlexNet Licensing)": "2023-golden",
-            "2022.HF9 (FlexNet Licensing)": "2022-2328",
-            "2022.HF5 (FlexNet Licensing)": "2022-2241",
-            "2022.HF4 (FlexNet Licensing)": "2022-2232",
-            "2022.HF3 (FlexNet Licensing)": "2022-2223",
-            "2022.HF1 (FlexNet Licensing)": "2022-2205",
-            "2022 Golden (FlexNet Licensing)": "2022-golden",
-            "2021.HF9 (FlexNet Licensing)": "2021-2140",
-            "2021.HF6 (FlexNet Licensing)": "2021-2117",
-            "2020.HF11 (FlexNet Licensing)": "2020-2136",
-            "2020.HF6 (FlexNet Licensing)": "2020-2046",
-            "2020.HF5 (FlexNet Licensing)": "2020-2038",
-            "2020 Golden (FlexNet Licensing)": "2020",
-            "2019.HF6 (FlexNet Licensing)": "2019-1947",
-            "2019 (FlexNet Licensing)": "2019",
-            "2018.HF10 (FlexNet Licensing)": "2018-1928",
-            "2018 (FlexNet Licensing HF4)": "2018",
-            "2017-efa-single-node": "2017-efa-single-node",
-            "2017": "2017",
-            "6.14-5": "6.14.5-pcmpi",
-            "6.14-3": "6.14.3-pcmpi",
-            "6.14-2": "6.14.2-pcmpi",
-            "6.13-5": "6.13.5-ibm",
-            "6.12-3": "6.12-3",
-        }
         try:
-            return codes[name]
+            return cls._VERSION_CODES[name]
+        except KeyError as err:
+            raise KeyError(
+                f"Key '{name}' not found! Available keys are: {cls._AVAILABLE_KEYS}"
+            ) from err
+
+    @classmethod
+    def get_version_name(cls, code: str) -> str:
+        """Convert version code to name."""
+        try:
+            return cls._CODE_TO_NAME[code]
         except KeyError as err:
-            available_keys = ", ".join(codes.keys())
             raise KeyError(
-                f"Key '{name}' not found! Available keys are: {available_keys}"
+                f"Code '{code}' not found! Available codes are: {cls._AVAILABLE_CODES}"
             ) from err
 
-@dataclass
-class Job(ApiResponse):
+@dataclass(slots=True)
+class Job:
     """Job submission handler."""
-    name: str
-    hardware: Optional[Hardware]
-    analyses: Optional[List[Software]]
+    name: Optional[str] = None
+    hardware: Optional[Hardware] = None
+    analyses: Optional[List[Software]] = None
+    id: Optional[str] = None
+
+    def _input_files(self):
+        """Iterate over the input files of all analyses."""
+        for analysis in self.analyses or ():
+            yield from analysis.inputfiles or ()
+
+    def _upload_pending_files(self) -> None:
+        """Upload input files of all analyses concurrently."""
+        _upload_concurrently(self._input_files())
 
     def create(self) -> None:
         """Create new job."""
+        self._upload_pending_files()
         json_data = {
             "name": self.name,
             "jobanalyses": [
-                analysis.to_json(self.hardware) for analysis in (self.analyses or [])
+                analysis.to_json(self.hardware) for analysis in (self.analyses or ())
             ],
         }
-        response = self.send_post("jobs/", json_data=json_data)
+        response = _API.send_post("jobs/", json_data=json_data)
         self.id = response["id"]
+        log.info("Created job %s (%s)", self.name, self.id)
 
     def submit(self) -> None:
         """Submit job for execution."""
         if not self.id:
             raise ValueError("Job must be created before submission")
-        self.send_post(f"jobs/{self.id}/submit/")
+        _API.send_post(f"jobs/{self.id}/submit/")
+        log.info("Submitted job %s", self.id)
+
+    def status(self) -> dict:
+        """Get job status history."""
+        if not self.id:
+            raise ValueError("Job must be created before checking status")
+        return _API.send_get(f"jobs/{self.id}/statuses/")
+
+    async def create_async(self) -> None:
+        """Create new job asynchronously."""
+        import asyncio
+
+        # Upload every pending input file of every analysis concurrently, hashing
+        # them on a thread to keep the event loop responsive
+        groups = await asyncio.to_thread(_group_pending, list(self._input_files()))
+        await asyncio.gather(
+            *(group[0]._upload_async(key) for key, group in groups.items())
+        )
+        _share_ids(groups)
+        json_data = {
+            "name": self.name,
+            "jobanalyses": [
+                analysis.to_json(self.hardware) for analysis in (self.analyses or ())
+            ],
+        }
+        response = await _ASYNC_API.send_post("jobs/", json_data=json_data)
+        self.id = response["id"]
+        log.info("Created job %s (%s)", self.name, self.id)
+
+    async def submit_async(self) -> None:
+        """Submit job for execution asynchronously."""
+        if not self.id:
+            raise ValueError("Job must be created before submission")
+        await _ASYNC_API.send_post(f"jobs/{self.id}/submit/")
+        log.info("Submitted job %s", self.id)
+
+    async def status_async(self) -> dict:
+        """Get job status history asynchronously."""
+        if not self.id:
+            raise ValueError("Job must be created before checking status")
+        return await _ASYNC_API.send_get(f"jobs/{self.id}/statuses/")
 
     @classmethod
     def load_from_id(cls, id: str) -> "Job":